@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from functools import lru_cache
 from types import MappingProxyType
 from typing import Any
 
@@ -59,6 +61,11 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {vol.Required(CONF_LIGHTS): cv.schema_with_slug_keys(LIGHT_SCHEMA)}
 )
 
+# Brightness level (0-255) of every percentage (0-100). Zero is kept as zero (off).
+_PERCENT_TO_BRIGHTNESS = (0,) + tuple(
+    value_to_brightness((1, 100), percent) for percent in range(1, 101)
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -215,6 +222,10 @@ class LightenerLight(LightGroup):
 
         self._is_frozen = True
 
+        # Lights receiving the same service and data are grouped into a single call, so the
+        # entity IDs are only added to the data when the calls are made.
+        service_calls: list[tuple[str, dict, list[str]]] = []
+
         for entity in self._entities:
             service = SERVICE_TURN_ON
             entity_brightness = None
@@ -226,39 +237,64 @@ class LightenerLight(LightGroup):
             # If the light brightness level is zero, we turn it off instead.
             if entity_brightness == 0:
                 service = SERVICE_TURN_OFF
-                entity_data = {}
 
                 # "Transition" is the only additional data allowed with the turn_off service.
-                if ATTR_TRANSITION in data:
-                    entity_data[ATTR_TRANSITION] = data[ATTR_TRANSITION]
+                entity_data = (
+                    {ATTR_TRANSITION: data[ATTR_TRANSITION]}
+                    if ATTR_TRANSITION in data
+                    else {}
+                )
+            elif brightness is None:
+                entity_data = data
             else:
-                # Make a copy of the data being sent to the lightener call so we can modify it.
-                entity_data = data.copy()
+                # Copy the data being sent to the lightener call, with the translated brightness.
+                entity_data = {**data, ATTR_BRIGHTNESS: entity_brightness}
 
-                # Set the translated brightness level.
-                if brightness is not None:
-                    entity_data[ATTR_BRIGHTNESS] = entity_brightness
+            for call_service, call_data, entity_ids in service_calls:
+                if call_service == service and call_data == entity_data:
+                    entity_ids.append(entity.entity_id)
+                    break
+            else:
+                service_calls.append((service, entity_data, [entity.entity_id]))
 
-            # Set the proper entity ID.
-            entity_data[ATTR_ENTITY_ID] = entity.entity_id
+        calls = []
 
-            await self.hass.services.async_call(
-                LIGHT_DOMAIN,
+        for service, entity_data, entity_ids in service_calls:
+            _LOGGER.debug(
+                "Calling service `%s` for `%s` with `%s`",
                 service,
+                entity_ids,
                 entity_data,
-                blocking=True,
-                context=self._context,
             )
 
-            _LOGGER.debug(
-                "Service `%s` called for `%s` (%s) with `%s`",
-                service,
-                entity.entity_id,
-                entity.type,
-                entity_data,
+            calls.append(
+                self.hass.services.async_call(
+                    LIGHT_DOMAIN,
+                    service,
+                    {**entity_data, ATTR_ENTITY_ID: entity_ids},
+                    blocking=True,
+                    context=self._context,
+                )
             )
 
-        self._is_frozen = False
+        try:
+            # Call the services of all controlled lights concurrently. All calls are awaited
+            # even if some of them fail, so none is left running in the background.
+            results = await asyncio.gather(*calls, return_exceptions=True)
+        finally:
+            self._is_frozen = False
+
+        errors = []
+
+        for (service, _, entity_ids), result in zip(service_calls, results):
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Error calling service `%s` for `%s`: %s",
+                    service,
+                    entity_ids,
+                    result,
+                )
+                errors.append(result)
 
         # Define a coroutine as a ha task.
         async def _async_refresh() -> None:
@@ -266,11 +302,17 @@ class LightenerLight(LightGroup):
             self.async_update_group_state()
             self.async_write_ha_state()
 
-        # Schedule the task to run.
+        # Schedule the task to run, starting it eagerly so the refresh (which never
+        # suspends) completes right away instead of waiting for the next loop iteration.
         self.hass.async_create_task(
-            _async_refresh(), name="Lightener [turn_on refresh]"
+            _async_refresh(), name="Lightener [turn_on refresh]", eager_start=True
         )
 
+        # Let the caller know that the lightener could not be fully turned on. The refresh
+        # above still picks up the lights that did change.
+        if errors:
+            raise errors[0]
+
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off all lights controlled by this Lightener."""
         self._is_frozen = True
@@ -351,7 +393,7 @@ class LightenerLight(LightGroup):
                                     entity.translate_brightness_back(entity_brightness)
                                 )
                             else:
-                                levels.append([])
+                                levels.append(())
 
             if levels:
                 # If the current lightener level is not present in the possible levels of the controlled lights.
@@ -398,6 +440,14 @@ class LightenerLight(LightGroup):
 class LightenerControlledLight:
     """Represents a light entity managed by a LightnerLight."""
 
+    __slots__ = (
+        "entity_id",
+        "hass",
+        "levels",
+        "to_lightener_levels",
+        "to_lightener_levels_on_off",
+    )
+
     def __init__(
         self: LightenerControlledLight,
         entity_id: str,
@@ -409,18 +459,18 @@ class LightenerControlledLight:
         self.entity_id = entity_id
         self.hass = hass
 
-        # Get the brightness configuration and prepare it for processing,
-        brightness_config = prepare_brightness_config(config.get("brightness", {}))
-
-        # Create the brightness conversion maps (from lightener to entity and from entity to lightener).
-        self.levels = create_brightness_map(brightness_config)
-        self.to_lightener_levels = create_reverse_brightness_map(
-            brightness_config, self.levels
-        )
-        self.to_lightener_levels_on_off = create_reverse_brightness_map_on_off(
-            self.to_lightener_levels
+        # Normalize the brightness configuration into a hashable key for the maps cache.
+        brightness = tuple(
+            sorted((int(k), int(v)) for k, v in config.get("brightness", {}).items())
         )
 
+        # Get the brightness conversion maps (from lightener to entity and from entity to lightener).
+        (
+            self.levels,
+            self.to_lightener_levels,
+            self.to_lightener_levels_on_off,
+        ) = build_brightness_maps(brightness)
+
     @property
     def type(self) -> str | None:
         """The entity type."""
@@ -433,25 +483,42 @@ class LightenerControlledLight:
     def translate_brightness(self, brightness: int) -> int:
         """Calculate the entitiy brightness for the give Lightener brightness level."""
 
-        level = self.levels.get(int(brightness))
+        level = self.levels[int(brightness)]
 
         if self.type == TYPE_ONOFF:
             return 0 if level == 0 else 255
 
         return level
 
-    def translate_brightness_back(self, brightness: int) -> list[int]:
+    def translate_brightness_back(self, brightness: int) -> tuple[int, ...]:
         """Calculate all possible Lightener brightness levels for a give entity brightness."""
 
         if brightness is None:
-            return []
-
-        levels = self.to_lightener_levels.get(int(brightness))
+            return ()
 
         if self.type == TYPE_ONOFF:
             return self.to_lightener_levels_on_off[int(brightness)]
 
-        return levels
+        return self.to_lightener_levels[int(brightness)]
+
+
+@lru_cache(maxsize=256)
+def build_brightness_maps(brightness: tuple[tuple[int, int], ...]) -> tuple:
+    """Create the brightness conversion maps for a brightness configuration.
+
+    The result is cached, so all lights with the same configuration share the same maps,
+    which must be treated as read-only.
+    """
+
+    brightness_config = prepare_brightness_config(dict(brightness))
+
+    levels = create_brightness_map(brightness_config)
+    to_lightener_levels = create_reverse_brightness_map(brightness_config, levels)
+    to_lightener_levels_on_off = create_reverse_brightness_map_on_off(
+        to_lightener_levels
+    )
+
+    return levels, to_lightener_levels, to_lightener_levels_on_off
 
 
 def translate_config_to_brightness(config: dict) -> dict:
@@ -461,9 +528,7 @@ def translate_config_to_brightness(config: dict) -> dict:
     """
 
     return {
-        value_to_brightness((1, 100), int(k)): 0
-        if int(v) == 0
-        else value_to_brightness((1, 100), int(v))
+        _PERCENT_TO_BRIGHTNESS[int(k)]: _PERCENT_TO_BRIGHTNESS[int(v)]
         for k, v in config.items()
     }
 
@@ -488,10 +553,10 @@ def prepare_brightness_config(config: dict) -> dict:
     return config
 
 
-def create_brightness_map(config: list) -> dict:
-    """Create a mapping of lightener levels to entity levels."""
+def create_brightness_map(config: list) -> bytes:
+    """Create a mapping of lightener levels (the index) to entity levels."""
 
-    brightness_map = {0: 0}
+    brightness_map = bytearray(256)
 
     for i in range(1, len(config)):
         start, end = config[i - 1][0], config[i][0]
@@ -501,20 +566,20 @@ def create_brightness_map(config: list) -> dict:
                 (start, end), (start_value, end_value), j
             )
 
-    return brightness_map
+    return bytes(brightness_map)
 
 
-def create_reverse_brightness_map(config: list, lightener_levels: dict) -> dict:
+def create_reverse_brightness_map(config: list, lightener_levels: bytes) -> tuple:
     """Create a map with all entity level (from 0 to 255) to all possible lightener levels at each entity level.
 
     There can be multiple lightener levels for a single entity level.
     """
 
     # Initialize with all levels from 0 to 255.
-    reverse_brightness_map = {i: [] for i in range(256)}
+    reverse_brightness_map = [[] for _ in range(256)]
 
     # Initialize entries with all lightener levels (it goes from 0 to 255)
-    for k, v in lightener_levels.items():
+    for k, v in enumerate(lightener_levels):
         reverse_brightness_map[v].append(k)
 
     # Now fill the gaps in the map by looping though the configured entity ranges
@@ -535,22 +600,22 @@ def create_reverse_brightness_map(config: list, lightener_levels: dict) -> dict:
                 if entity_level not in reverse_brightness_map[j]:
                     reverse_brightness_map[j].append(entity_level)
 
-    return reverse_brightness_map
+    # Freeze the map, as it may be shared by many lights.
+    return tuple(tuple(levels) for levels in reverse_brightness_map)
 
 
-def create_reverse_brightness_map_on_off(reverse_map: dict) -> dict:
+def create_reverse_brightness_map_on_off(reverse_map: tuple) -> tuple:
     """Create a reversed map dedicated to on/off lights."""
 
-    # Build the "on" state out of all levels which are not in the "off" state.
-    on_levels = [i for i in range(1, 256) if i not in reverse_map[0]]
-
-    # The "on" levels are possible for all non-zero levels.
-    reverse_map_on_off = {i: on_levels for i in range(1, 256)}
+    off_levels = reverse_map[0]
 
-    # The "off" matches the normal reverse map.
-    reverse_map_on_off[0] = reverse_map[0]
+    # Build the "on" state out of all levels which are not in the "off" state.
+    off_levels_set = set(off_levels)
+    on_levels = tuple(i for i in range(1, 256) if i not in off_levels_set)
 
-    return reverse_map_on_off
+    # The "off" matches the normal reverse map, while the same "on" levels are possible
+    # for all non-zero levels.
+    return (off_levels,) + (on_levels,) * 255
 
 
 def scale_ranged_value_to_int_range(
@@ -1 +1,11 @@
 """Tests for Lightener."""
+
+from itertools import count
+
+_unique_ids = count()
+
+
+def generate_unique_id() -> str:
+    """Return an id that is unique within the test session."""
+
+    return f"test-{next(_unique_ids):08x}"
@@ -1,16 +1,19 @@
 """Fixtures for testing."""
 
 from collections.abc import Callable
-from uuid import uuid4
+from types import MappingProxyType
+from unittest.mock import AsyncMock
 
 import pytest
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceRegistry
 from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.setup import async_setup_component
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.lightener.light import LightenerLight
+from custom_components.lightener.light import LightenerControlledLight, LightenerLight
+
+from . import generate_unique_id
 
 
 @pytest.fixture(autouse=True)
@@ -49,6 +52,24 @@ async def setup_test_lights(hass: HomeAssistant):
     await hass.async_block_till_done()
 
 
+@pytest.fixture(scope="session")
+def living_room_config() -> MappingProxyType:
+    """Return the configuration of a lightener without controlled lights."""
+
+    # Read-only, as it is shared by all tests.
+    return MappingProxyType({"friendly_name": "Living Room"})
+
+
+@pytest.fixture
+def async_call_mock(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace service calls with a mock, so they can be asserted without being executed."""
+
+    mock = AsyncMock()
+    monkeypatch.setattr(ServiceRegistry, "async_call", mock)
+
+    return mock
+
+
 @pytest.fixture
 async def create_lightener(
     hass: HomeAssistant,
@@ -58,7 +79,7 @@ async def create_lightener(
     async def creator(name: str | None = None, config: dict | None = None) -> str:
         entry = MockConfigEntry(
             domain="lightener",
-            unique_id=str(uuid4()),
+            unique_id=generate_unique_id(),
             data={
                 "friendly_name": name or "Test",
                 "entities": {"light.test1": {}},
@@ -75,3 +96,18 @@ async def create_lightener(
         return platform[0].entities["light.test"]
 
     return creator
+
+
+@pytest.fixture
+def controlled_light_10_100(hass: HomeAssistant) -> LightenerControlledLight:
+    """Create a controlled light.test1 that reaches full brightness at 10%."""
+
+    return LightenerControlledLight(
+        "light.test1",
+        {
+            "brightness": {
+                "10": "100"  # 26: 255
+            }
+        },
+        hass,
+    )
@@ -1,7 +1,7 @@
 """Tests for config_flow."""
 
 from typing import Any
-from uuid import uuid4
+from unittest.mock import patch
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -14,6 +14,14 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.lightener import const
 from custom_components.lightener.config_flow import LightenerConfigFlow
 
+from . import generate_unique_id
+
+# The entry data created by test_config_flow_steps.
+_EXPECTED_ENTRY = {
+    CONF_FRIENDLY_NAME: "Test Name",
+    CONF_ENTITIES: {"light.test1": {CONF_BRIGHTNESS: {"10": "20"}}},
+}
+
 
 async def test_config_flow_steps(hass: HomeAssistant) -> None:
     """Test if the full config flow works."""
@@ -22,9 +30,7 @@ async def test_config_flow_steps(hass: HomeAssistant) -> None:
         const.DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
 
-    assert result["type"] == "form"
-    assert result["step_id"] == "user"
-    assert result["last_step"] is False
+    assert_form(result, "user", last_step=False)
 
     assert get_required(result, "name") is True
 
@@ -32,9 +38,7 @@ async def test_config_flow_steps(hass: HomeAssistant) -> None:
         result["flow_id"], user_input={"name": "Test Name"}
     )
 
-    assert result["type"] == "form"
-    assert result["step_id"] == "lights"
-    assert result["last_step"] is False
+    assert_form(result, "lights", last_step=False)
 
     assert get_required(result, "controlled_entities") is True
 
@@ -43,9 +47,7 @@ async def test_config_flow_steps(hass: HomeAssistant) -> None:
         user_input={"controlled_entities": ["light.test1"]},
     )
 
-    assert result["type"] == "form"
-    assert result["step_id"] == "light_configuration"
-    assert result["last_step"] is True
+    assert_form(result, "light_configuration", last_step=True)
     assert result["description_placeholders"] == {
         "light_name": "test1",
         "current_brightness": "off",
@@ -53,17 +55,21 @@ async def test_config_flow_steps(hass: HomeAssistant) -> None:
 
     assert get_required(result, "brightness") is False
 
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        user_input={"brightness": "10:20"},
-    )
+    # The entry setup is covered by test_init, so skip it here.
+    with patch(
+        "custom_components.lightener.async_setup_entry", return_value=True
+    ) as mock_setup_entry:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={"brightness": "10:20"},
+        )
+        await hass.async_block_till_done()
+
+    mock_setup_entry.assert_called_once()
 
     assert result["type"] == "create_entry"
     assert result["title"] == "Test Name"
-    assert result["data"] == {
-        CONF_FRIENDLY_NAME: "Test Name",
-        CONF_ENTITIES: {"light.test1": {CONF_BRIGHTNESS: {"10": "20"}}},
-    }
+    assert result["data"] == _EXPECTED_ENTRY
 
 
 async def test_options_flow_steps(hass: HomeAssistant) -> None:
@@ -72,7 +78,7 @@ async def test_options_flow_steps(hass: HomeAssistant) -> None:
     entry = MockConfigEntry(
         domain="lightener",
         version=LightenerConfigFlow.VERSION,
-        unique_id=str(uuid4()),
+        unique_id=generate_unique_id(),
         data={
             CONF_ENTITIES: {
                 "light.test1": {CONF_BRIGHTNESS: {"10": "20"}},
@@ -84,9 +90,7 @@ async def test_options_flow_steps(hass: HomeAssistant) -> None:
 
     result = await hass.config_entries.options.async_init(entry.entry_id)
 
-    assert result["type"] == "form"
-    assert result["step_id"] == "init"
-    assert result["last_step"] is False
+    assert_form(result, "init", last_step=False)
 
     assert get_default(result, "controlled_entities") == ["light.test1", "light.test2"]
 
@@ -95,9 +99,7 @@ async def test_options_flow_steps(hass: HomeAssistant) -> None:
         user_input={"controlled_entities": ["light.test1"]},
     )
 
-    assert result["type"] == "form"
-    assert result["step_id"] == "light_configuration"
-    assert result["last_step"] is True
+    assert_form(result, "light_configuration", last_step=True)
 
     assert get_suggested(result, "brightness") == "10: 20"
 
@@ -122,7 +124,7 @@ async def test_step_lights_no_lightener(hass: HomeAssistant) -> None:
 
     entry = MockConfigEntry(
         domain="lightener",
-        unique_id=str(uuid4()),
+        unique_id=generate_unique_id(),
         data={CONF_ENTITIES: {"light.test1": {CONF_BRIGHTNESS: {"10": "20"}}}},
     )
     entry.add_to_hass(hass)
@@ -132,7 +134,7 @@ async def test_step_lights_no_lightener(hass: HomeAssistant) -> None:
     entity_registry.async_get_or_create(
         domain="light",
         platform="lightener",
-        unique_id=str(uuid4()),
+        unique_id=generate_unique_id(),
         config_entry=entry,
         suggested_object_id="test_lightener",
     )
@@ -145,12 +147,7 @@ async def test_step_lights_no_lightener(hass: HomeAssistant) -> None:
 async def test_step_lights_error_no_selection(hass: HomeAssistant) -> None:
     """Test if the list of lights to select doesn't include the lightener being configured."""
 
-    result = await hass.config_entries.flow.async_init(
-        const.DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input={"name": "Test Name"}
-    )
+    result = await start_config_flow(hass)
 
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
@@ -164,12 +161,7 @@ async def test_step_lights_error_no_selection(hass: HomeAssistant) -> None:
 async def test_step_light_configuration_multiple_lights(hass: HomeAssistant) -> None:
     """Test if the flow works when multiple lights are selected."""
 
-    result = await hass.config_entries.flow.async_init(
-        const.DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-    result = await hass.config_entries.flow.async_configure(
-        result["flow_id"], user_input={"name": "Test Name"}
-    )
+    result = await start_config_flow(hass)
 
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
@@ -194,12 +186,7 @@ async def test_step_light_configuration_brightness_validation(
     """Test the input validation of the brightness field."""
 
     async def assert_value(must_pass, value, error_value=None):
-        result = await hass.config_entries.flow.async_init(
-            const.DOMAIN, context={"source": config_entries.SOURCE_USER}
-        )
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"], user_input={"name": "Test Name"}
-        )
+        result = await start_config_flow(hass)
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
             user_input={"controlled_entities": ["light.test1"]},
@@ -251,6 +238,30 @@ async def test_step_light_configuration_brightness_validation(
     await assert_value(True, "")
 
 
+async def start_config_flow(hass: HomeAssistant) -> FlowResult:
+    """Start a config flow and submit the name step, returning the lights step form."""
+
+    result = await hass.config_entries.flow.async_init(
+        const.DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={"name": "Test Name"}
+    )
+
+
+def assert_form(
+    result: FlowResult, step_id: str, last_step: bool | None = None
+) -> None:
+    """Assert that the flow result is the form of the given step."""
+
+    assert result["type"] == "form"
+    assert result["step_id"] == step_id
+
+    if last_step is not None:
+        assert result["last_step"] is last_step
+
+
 def get_default(form: FlowResult, key: str) -> Any:
     """Get default value for key in voluptuous schema."""
 
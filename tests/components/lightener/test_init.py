@@ -1,9 +1,13 @@
 """Tests for __init__."""
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 from unittest.mock import Mock, patch
 
-from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+import pytest
+from homeassistant.config_entries import ConfigEntries, ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -14,6 +18,22 @@ from custom_components.lightener import (
 from custom_components.lightener.config_flow import LightenerConfigFlow
 from custom_components.lightener.const import DOMAIN
 
+_CONFIG_V1 = MappingProxyType(
+    {
+        "friendly_name": "Test",
+        "entities": {
+            "light.test1": {
+                "10": "20",
+                "30": "40",
+            },
+            "light.test2": {
+                "50": "60",
+                "70": "80",
+            },
+        },
+    }
+)
+
 
 async def test_async_setup_entry(hass):
     """Test setting up Lightener successfully."""
@@ -29,7 +49,6 @@ async def test_async_setup_entry(hass):
     config_entry.add_to_hass(hass)
 
     assert await hass.config_entries.async_setup(config_entry.entry_id)
-    await hass.async_block_till_done()
     assert "lightener.light" in hass.config.components
 
 
@@ -64,17 +83,7 @@ async def test_async_unload_entry(mock_unload, hass):
 async def test_migrate_entry_current(hass: HomeAssistant) -> None:
     """Test is the migration does nothing for an up-to-date configuration."""
 
-    config_entry = ConfigEntry(
-        version=LightenerConfigFlow.VERSION,
-        minor_version=LightenerConfigFlow.VERSION,
-        title="lightener",
-        domain=DOMAIN,
-        data={},
-        source="user",
-        unique_id=None,
-        options=None,
-        discovery_keys=[],
-    )
+    config_entry = create_config_entry(LightenerConfigFlow.VERSION)
 
     data = config_entry.data
 
@@ -83,39 +92,17 @@ async def test_migrate_entry_current(hass: HomeAssistant) -> None:
     assert config_entry.data is data
 
 
-async def test_migrate_entry_v1(hass: HomeAssistant) -> None:
+async def test_migrate_entry_v1(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test is the migration does nothing for an up-to-date configuration."""
 
-    config_v1 = {
-        "friendly_name": "Test",
-        "entities": {
-            "light.test1": {
-                "10": "20",
-                "30": "40",
-            },
-            "light.test2": {
-                "50": "60",
-                "70": "80",
-            },
-        },
-    }
-
-    config_entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        title="lightener",
-        domain=DOMAIN,
-        data=config_v1,
-        source="user",
-        unique_id=None,
-        options=None,
-        discovery_keys=[],
-    )
+    config_entry = create_config_entry(1, _CONFIG_V1)
 
     mock = Mock()
+    monkeypatch.setattr(ConfigEntries, "async_update_entry", mock)
 
-    with patch.object(hass.config_entries, "async_update_entry") as mock:
-        assert await async_migrate_entry(hass, config_entry) is True
+    assert await async_migrate_entry(hass, config_entry) is True
 
     assert mock.call_count == 1
     assert mock.call_args.kwargs.get("data") == {
@@ -130,19 +117,27 @@ async def test_migrate_entry_v1(hass: HomeAssistant) -> None:
 async def test_migrate_unkown_version(hass: HomeAssistant) -> None:
     """Test is the migration does nothing for an up-to-date configuration."""
 
-    config_entry = ConfigEntry(
-        version=1000,
-        minor_version=1000,
+    config_entry = create_config_entry(1000)
+
+    with patch.object(logging.Logger, "error") as mock:
+        assert await async_migrate_entry(hass, config_entry) is False
+
+    mock.assert_called_once_with('Unknow configuration version "%i"', 1000)
+
+
+def create_config_entry(
+    version: int, data: Mapping[str, Any] | None = None
+) -> ConfigEntry:
+    """Create a Lightener config entry with the given version and data."""
+
+    return ConfigEntry(
+        version=version,
+        minor_version=version,
         title="lightener",
         domain=DOMAIN,
-        data={},
+        data={} if data is None else data,
         source="user",
         unique_id=None,
         options=None,
         discovery_keys=[],
     )
-
-    with patch.object(logging.Logger, "error") as mock:
-        assert await async_migrate_entry(hass, config_entry) is False
-
-    mock.assert_called_once_with('Unknow configuration version "%i"', 1000)
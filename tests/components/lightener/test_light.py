@@ -1,19 +1,21 @@
 """Tests for the light platform."""
 
-from unittest.mock import ANY, Mock, patch
-from uuid import uuid4
+from types import MappingProxyType
+from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 from homeassistant.components.light import ATTR_TRANSITION, ColorMode
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON
-from homeassistant.core import HomeAssistant, ServiceRegistry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 
 from custom_components.lightener.const import TYPE_DIMMABLE, TYPE_ONOFF
 from custom_components.lightener.light import (
     LightenerControlledLight,
     LightenerLight,
     async_setup_platform,
+    build_brightness_maps,
     create_brightness_map,
     create_reverse_brightness_map,
     create_reverse_brightness_map_on_off,
@@ -22,17 +24,26 @@ from custom_components.lightener.light import (
     translate_config_to_brightness,
 )
 
+from . import generate_unique_id
+
+# Lightener controlling light.test1, which stays off up to 50% of the lightener brightness.
+_CONFIG_TEST1_OFF_UNTIL_50 = MappingProxyType(
+    {
+        "friendly_name": "Test",
+        "entities": {"light.test1": {"50": "0"}},
+    }
+)
+
 ###########################################################
 ### LightenerLight class only tests
 
 
-async def test_lightener_light_properties(hass):
+def test_lightener_light_properties(hass, living_room_config):
     """Test all the basic properties of the LightenerLight class."""
 
-    config = {"friendly_name": "Living Room"}
-    unique_id = str(uuid4())
+    unique_id = generate_unique_id()
 
-    lightener = LightenerLight(hass, config, unique_id)
+    lightener = LightenerLight(hass, living_room_config, unique_id)
 
     assert lightener.unique_id == unique_id
 
@@ -46,12 +57,10 @@ async def test_lightener_light_properties(hass):
     assert lightener.icon == "mdi:lightbulb-group"
 
 
-async def test_lightener_light_properties_no_unique_id(hass):
+def test_lightener_light_properties_no_unique_id(hass, living_room_config):
     """Test all the basic properties of the LightenerLight class when no unique id is provided."""
 
-    config = {"friendly_name": "Living Room"}
-
-    lightener = LightenerLight(hass, config)
+    lightener = LightenerLight(hass, living_room_config)
 
     assert lightener.unique_id is None
     assert lightener.device_info is None
@@ -72,27 +81,27 @@ async def test_lightener_light_turn_on(hass: HomeAssistant, create_lightener):
     )
 
     await lightener.async_turn_on()
-    await hass.async_block_till_done()
 
+    # The controlled lights are called with blocking service calls, so their states are
+    # already up to date once turn_on returns.
     assert hass.states.get("light.test1").state == "on"
     assert hass.states.get("light.test2").state == "on"
 
 
-async def test_lightener_light_turn_on_forward(hass: HomeAssistant, create_lightener):  # pylint: disable=unused-argument
+async def test_lightener_light_turn_on_forward(
+    async_call_mock: AsyncMock, create_lightener
+):
     """Test if passed arguments are forwared when turned on."""
 
     lightener: LightenerLight = await create_lightener()
 
-    with patch.object(ServiceRegistry, "async_call") as async_call_mock:
-        await lightener.async_turn_on(
-            brightness=50, effect="blink", color_temp_kelvin=3000
-        )
+    await lightener.async_turn_on(brightness=50, effect="blink", color_temp_kelvin=3000)
 
     async_call_mock.assert_called_once_with(
         LIGHT_DOMAIN,
         SERVICE_TURN_ON,
         {
-            ATTR_ENTITY_ID: "light.test1",
+            ATTR_ENTITY_ID: ["light.test1"],
             "brightness": 50,
             "effect": "blink",
             "color_temp_kelvin": 3000,
@@ -102,67 +111,118 @@ async def test_lightener_light_turn_on_forward(hass: HomeAssistant, create_light
     )
 
 
-async def test_lightener_light_turn_on_go_off_if_brightness_0(
-    hass: HomeAssistant, create_lightener
+async def test_lightener_light_turn_on_grouped_calls(
+    async_call_mock: AsyncMock, create_lightener
 ):
-    """Test that turned on sends brightness 0 if the controlled light is on."""
+    """Test that lights receiving the same data are turned on with a single service call."""
 
     lightener: LightenerLight = await create_lightener(
         config={
             "friendly_name": "Test",
-            "entities": {"light.test1": {"50": "0"}},
+            "entities": {
+                "light.test1": {},
+                "light.test2": {},
+                "light.test_temp": {"50": "100"},
+            },
         }
     )
 
-    hass.states.async_set(entity_id="light.test1", new_state="on")
+    await lightener.async_turn_on(brightness=64)
 
-    await lightener.async_turn_on(brightness=1)
-    await hass.async_block_till_done()
+    assert async_call_mock.call_count == 2
 
-    assert hass.states.get("light.test1").state == "off"
+    async_call_mock.assert_any_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: ["light.test1", "light.test2"], "brightness": 64},
+        blocking=True,
+        context=ANY,
+    )
+    async_call_mock.assert_any_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: ["light.test_temp"], "brightness": 128},
+        blocking=True,
+        context=ANY,
+    )
 
 
-async def test_lightener_light_turn_on_translate_brightness(
-    hass: HomeAssistant, create_lightener
+async def test_lightener_light_turn_on_failed_call(
+    async_call_mock: AsyncMock, create_lightener
 ):
-    """Test that turned on sends brightness 0 if the controlled light is on."""
+    """Test that a failing controlled light doesn't stop the other calls nor freeze the lightener."""
 
     lightener: LightenerLight = await create_lightener(
         config={
             "friendly_name": "Test",
-            "entities": {"light.test1": {"50": "0"}},
+            "entities": {
+                "light.test1": {},
+                "light.test_temp": {"50": "100"},
+            },
         }
     )
+
+    def async_call(domain, service, service_data, **kwargs):
+        if service_data[ATTR_ENTITY_ID] == ["light.test1"]:
+            raise HomeAssistantError("Failed")
+
+    async_call_mock.side_effect = async_call
+
+    with pytest.raises(HomeAssistantError):
+        await lightener.async_turn_on(brightness=64)
+
+    assert async_call_mock.await_count == 2
+    assert lightener._is_frozen is False  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "brightness, expected_state, expected_brightness",
+    [
+        # The controlled light goes off if its brightness translates to 0.
+        (1, "off", None),
+        (192, "on", 129),
+    ],
+)
+async def test_lightener_light_turn_on_translate_brightness(
+    brightness,
+    expected_state,
+    expected_brightness,
+    hass: HomeAssistant,
+    create_lightener,
+):
+    """Test the brightness sent to a controlled light that is on."""
+
+    lightener: LightenerLight = await create_lightener(
+        config=_CONFIG_TEST1_OFF_UNTIL_50
+    )
+
     hass.states.async_set(entity_id="light.test1", new_state="on")
 
-    await lightener.async_turn_on(brightness=192)
-    await hass.async_block_till_done()
+    await lightener.async_turn_on(brightness=brightness)
 
-    assert hass.states.get("light.test1").state == "on"
-    assert hass.states.get("light.test1").attributes["brightness"] == 129
+    state = hass.states.get("light.test1")
+
+    assert state.state == expected_state
+    assert state.attributes.get("brightness") == expected_brightness
 
 
 async def test_lightener_light_turn_on_go_off_if_brightness_0_transition(
-    hass: HomeAssistant, create_lightener
+    hass: HomeAssistant, async_call_mock: AsyncMock, create_lightener
 ):
     """Test that turned on sends brightness 0 if the controlled light is on."""
 
     lightener: LightenerLight = await create_lightener(
-        config={
-            "friendly_name": "Test",
-            "entities": {"light.test1": {"50": "0"}},
-        }
+        config=_CONFIG_TEST1_OFF_UNTIL_50
     )
 
     hass.states.async_set(entity_id="light.test1", new_state="on")
 
-    with patch.object(ServiceRegistry, "async_call") as async_call_mock:
-        await lightener.async_turn_on(brightness=1, transition=10)
+    await lightener.async_turn_on(brightness=1, transition=10)
 
     async_call_mock.assert_called_once_with(
         LIGHT_DOMAIN,
         SERVICE_TURN_OFF,
-        {ATTR_ENTITY_ID: "light.test1", ATTR_TRANSITION: 10},
+        {ATTR_ENTITY_ID: ["light.test1"], ATTR_TRANSITION: 10},
         blocking=True,
         context=ANY,
     )
@@ -261,139 +321,90 @@ async def test_lightener_light_color_mode_unknown(
     assert lightener.color_mode is None
 
 
+@pytest.mark.parametrize(
+    "config, attributes, expected_brightness",
+    [
+        (_CONFIG_TEST1_OFF_UNTIL_50, {"color_temp_kelvin": 3000}, 255),
+        (_CONFIG_TEST1_OFF_UNTIL_50, {"brightness": 255}, 255),
+        (_CONFIG_TEST1_OFF_UNTIL_50, {"brightness": 1}, 128),
+        (_CONFIG_TEST1_OFF_UNTIL_50, {"brightness": 0}, 0),
+        # Zero
+        (
+            {"friendly_name": "Test", "entities": {"light.test1": {}}},
+            {"brightness": 0},
+            0,
+        ),
+        # Unavailable
+        (
+            {
+                "friendly_name": "Test",
+                "entities": {"light.test1": {"50": "0"}, "light.I_DONT_EXIST": {}},
+            },
+            {"brightness": 1},
+            128,
+        ),
+    ],
+)
 async def test_lightener_light_async_update_group_state(
-    hass: HomeAssistant, create_lightener
+    config, attributes, expected_brightness, hass: HomeAssistant, create_lightener
 ):
-    """Test that turned on does nothing if the controlled light is already off."""
+    """Test the lightener brightness calculated from the controlled light state."""
 
-    lightener: LightenerLight = await create_lightener(
-        config={
-            "friendly_name": "Test",
-            "entities": {"light.test1": {"50": "0"}},
-        }
-    )
+    lightener: LightenerLight = await create_lightener(config=config)
 
     lightener._attr_brightness = 150  # pylint: disable=protected-access
 
     hass.states.async_set(
-        entity_id="light.test1", new_state="on", attributes={"color_temp_kelvin": 3000}
+        entity_id="light.test1", new_state="on", attributes=attributes
     )
 
     lightener.async_update_group_state()
 
     assert lightener.is_on is True
-    assert lightener.color_temp_kelvin == 3000
-
-    assert lightener.brightness == 255
-
-    hass.states.async_set(
-        entity_id="light.test1", new_state="on", attributes={"brightness": 255}
-    )
-
-    lightener.async_update_group_state()
-
-    assert lightener.brightness == 255
-
-    hass.states.async_set(
-        entity_id="light.test1", new_state="on", attributes={"brightness": 1}
-    )
-
-    lightener.async_update_group_state()
-
-    assert lightener.brightness == 128
-
-    hass.states.async_set(
-        entity_id="light.test1", new_state="on", attributes={"brightness": 0}
-    )
+    assert lightener.brightness == expected_brightness
 
-    lightener.async_update_group_state()
-
-    assert lightener.is_on is True
-    assert lightener.brightness == 0
+    if "color_temp_kelvin" in attributes:
+        assert lightener.color_temp_kelvin == attributes["color_temp_kelvin"]
 
 
-async def test_lightener_light_async_update_group_state_zero(
-    hass: HomeAssistant, create_lightener
+@pytest.mark.parametrize(
+    "test1, test2, result",
+    [
+        # Matches
+        (0, 29, 3),
+        (1, 255, 128),
+        # No matches
+        (129, 1, 150),
+        (1, 254, 150),
+        (1, 1, 150),
+        (1, None, 150),
+    ],
+)
+async def test_lightener_light_async_update_group_state_no_match_no_change(
+    test1, test2, result, hass: HomeAssistant, create_lightener
 ):
     """Test that turned on does nothing if the controlled light is already off."""
 
     lightener: LightenerLight = await create_lightener(
         config={
             "friendly_name": "Test",
-            "entities": {"light.test1": {}},
+            "entities": {"light.test1": {"50": "0"}, "light.test2": {"10": "100"}},
         }
     )
 
     lightener._attr_brightness = 150  # pylint: disable=protected-access
 
     hass.states.async_set(
-        entity_id="light.test1", new_state="on", attributes={"brightness": 0}
-    )
-
-    lightener.async_update_group_state()
-
-    assert lightener.brightness == 0
-
-
-async def test_lightener_light_async_update_group_state_unavailable(
-    hass: HomeAssistant, create_lightener
-):
-    """Test that turned on does nothing if the controlled light is already off."""
-
-    lightener: LightenerLight = await create_lightener(
-        config={
-            "friendly_name": "Test",
-            "entities": {"light.test1": {"50": "0"}, "light.I_DONT_EXIST": {}},
-        }
+        entity_id="light.test1", new_state="on", attributes={"brightness": test1}
     )
 
-    lightener._attr_brightness = 150  # pylint: disable=protected-access
-
     hass.states.async_set(
-        entity_id="light.test1", new_state="on", attributes={"brightness": 1}
+        entity_id="light.test2", new_state="on", attributes={"brightness": test2}
     )
 
     lightener.async_update_group_state()
 
-    assert lightener.brightness == 128
-
-
-async def test_lightener_light_async_update_group_state_no_match_no_change(
-    hass: HomeAssistant, create_lightener
-):
-    """Test that turned on does nothing if the controlled light is already off."""
-
-    lightener: LightenerLight = await create_lightener(
-        config={
-            "friendly_name": "Test",
-            "entities": {"light.test1": {"50": "0"}, "light.test2": {"10": "100"}},
-        }
-    )
-
-    def test(test1: int, test2: int, result: int):
-        lightener._attr_brightness = 150  # pylint: disable=protected-access
-
-        hass.states.async_set(
-            entity_id="light.test1", new_state="on", attributes={"brightness": test1}
-        )
-
-        hass.states.async_set(
-            entity_id="light.test2", new_state="on", attributes={"brightness": test2}
-        )
-
-        lightener.async_update_group_state()
-
-        assert lightener.brightness == result
-
-    # Matches
-    test(0, 29, 3)
-    test(1, 255, 128)
-
-    # No matches
-    test(129, 1, 150)
-    test(1, 254, 150)
-    test(1, 1, 150)
-    test(1, None, 150)
+    assert lightener.brightness == result
 
 
 @pytest.mark.parametrize(
@@ -460,7 +471,7 @@ async def test_lightener_light_async_update_group_state_onoff(
 ### LightenerControlledLight class only tests
 
 
-async def test_lightener_light_entity_properties(hass):
+def test_lightener_light_entity_properties(hass):
     """Test all the basic properties of the LightenerLight class."""
 
     light = LightenerControlledLight("light.test1", {"brightness": {"10": "20"}}, hass)
@@ -468,46 +479,32 @@ async def test_lightener_light_entity_properties(hass):
     assert light.entity_id == "light.test1"
 
 
-async def test_lightener_light_entity_calculated_levels(hass):
-    """Test the calculation of brigthness levels."""
-
-    light = LightenerControlledLight(
-        "light.test1",
-        {
-            "brightness": {
-                "10": "100",
-            }
-        },
-        hass,
-    )
-
-    assert light.levels[0] == 0
-    assert light.levels[13] == 128
-    assert light.levels[25] == 245
-    assert light.levels[26] == 255
-    assert light.levels[27] == 255
-    assert light.levels[100] == 255
-    assert light.levels[255] == 255
-
-    light = LightenerControlledLight(
-        "light.test1",
-        {
-            "brightness": {
+@pytest.mark.parametrize(
+    "brightness, expected_levels",
+    [
+        (
+            {"10": "100"},
+            {0: 0, 13: 128, 25: 245, 26: 255, 27: 255, 100: 255, 255: 255},
+        ),
+        (
+            {
                 "100": "0",  # Test the ordering
                 "10": "10",
                 "50": "100",
-            }
-        },
-        hass,
-    )
+            },
+            {0: 0, 15: 15, 26: 26, 27: 28, 128: 255, 129: 253, 255: 0},
+        ),
+    ],
+)
+async def test_lightener_light_entity_calculated_levels(
+    brightness, expected_levels, hass
+):
+    """Test the calculation of brigthness levels."""
+
+    light = LightenerControlledLight("light.test1", {"brightness": brightness}, hass)
 
-    assert light.levels[0] == 0
-    assert light.levels[15] == 15
-    assert light.levels[26] == 26
-    assert light.levels[27] == 28
-    assert light.levels[128] == 255
-    assert light.levels[129] == 253
-    assert light.levels[255] == 0
+    for lightener_level, entity_level in expected_levels.items():
+        assert light.levels[lightener_level] == entity_level
 
 
 async def test_lightener_light_entity_calculated_to_lightner_levels(hass):
@@ -523,11 +520,11 @@ async def test_lightener_light_entity_calculated_to_lightner_levels(hass):
         hass,
     )
 
-    assert light.to_lightener_levels[0] == [0]
-    assert light.to_lightener_levels[26] == [3]
-    assert light.to_lightener_levels[253] == [26]
-    assert light.to_lightener_levels[254] == [26]
-    assert light.to_lightener_levels[255] == list(range(26, 256))
+    assert light.to_lightener_levels[0] == (0,)
+    assert light.to_lightener_levels[26] == (3,)
+    assert light.to_lightener_levels[253] == (26,)
+    assert light.to_lightener_levels[254] == (26,)
+    assert light.to_lightener_levels[255] == tuple(range(26, 256))
 
     light = LightenerControlledLight(
         "light.test1",
@@ -541,12 +538,38 @@ async def test_lightener_light_entity_calculated_to_lightner_levels(hass):
         hass,
     )
 
-    assert light.to_lightener_levels[0] == [0, 255]
-    assert light.to_lightener_levels[26] == [26, 242]
-    assert light.to_lightener_levels[255] == [128]
+    assert light.to_lightener_levels[0] == (0, 255)
+    assert light.to_lightener_levels[26] == (26, 242)
+    assert light.to_lightener_levels[255] == (128,)
+
+    assert light.to_lightener_levels[3] == (3, 254)
+    assert light.to_lightener_levels[10] == (10, 250)
+
 
-    assert light.to_lightener_levels[3] == [3, 254]
-    assert light.to_lightener_levels[10] == [10, 250]
+async def test_lightener_light_entity_shared_maps(hass):
+    """Test that lights with the same brightness configuration share their maps."""
+
+    light1 = LightenerControlledLight(
+        "light.test1", {"brightness": {"10": "100"}}, hass
+    )
+    light2 = LightenerControlledLight(
+        "light.test2", {"brightness": {"10": "100"}}, hass
+    )
+
+    assert light1.levels is light2.levels
+    assert light1.to_lightener_levels is light2.to_lightener_levels
+    assert isinstance(light1.to_lightener_levels[255], tuple)
+
+    # The order of the configuration entries doesn't matter.
+    light3 = LightenerControlledLight(
+        "light.test3", {"brightness": {"50": "100", "10": "10"}}, hass
+    )
+    light4 = LightenerControlledLight(
+        "light.test4", {"brightness": {"10": "10", "50": "100"}}, hass
+    )
+
+    assert light3.levels is light4.levels
+    assert light3.levels is not light1.levels
 
 
 @pytest.mark.parametrize(
@@ -622,36 +645,20 @@ async def test_lightener_light_entity_translate_brightness_dimmable_onoff(
     assert light.translate_brightness(lightener_level) == light_level
 
 
-async def test_lightener_light_entity_translate_brightness_float(hass):
+async def test_lightener_light_entity_translate_brightness_float(
+    controlled_light_10_100: LightenerControlledLight,
+):
     """Test translate_brightness_back with float values."""
 
-    light = LightenerControlledLight(
-        "light.test1",
-        {
-            "brightness": {
-                "10": "100"  # 26: 255
-            }
-        },
-        hass,
-    )
-
-    assert light.translate_brightness(2.9) == 20
+    assert controlled_light_10_100.translate_brightness(2.9) == 20
 
 
-async def test_lightener_light_entity_translate_brightness_back_float(hass):
+async def test_lightener_light_entity_translate_brightness_back_float(
+    controlled_light_10_100: LightenerControlledLight,
+):
     """Test translate_brightness_back with float values."""
 
-    light = LightenerControlledLight(
-        "light.test1",
-        {
-            "brightness": {
-                "10": "100"  # 26: 255
-            }
-        },
-        hass,
-    )
-
-    assert light.translate_brightness_back(25.9) == [3]
+    assert controlled_light_10_100.translate_brightness_back(25.9) == (3,)
 
 
 ###########################################################
@@ -663,7 +670,8 @@ async def test_async_setup_platform(hass):
 
     # pylint: disable=W0212
 
-    async_add_entities_mock = Mock()
+    created_lights: list[LightenerLight] = []
+    async_add_entities_mock = Mock(side_effect=created_lights.extend)
 
     config = {
         "platform": "lightener",
@@ -683,8 +691,6 @@ async def test_async_setup_platform(hass):
 
     assert async_add_entities_mock.call_count == 1
 
-    created_lights: list = async_add_entities_mock.call_args.args[0]
-
     assert len(created_lights) == 2
 
     light: LightenerLight = created_lights[0]
@@ -743,6 +749,25 @@ def test_translate_config_to_brightness(config, expected_result):
     assert translate_config_to_brightness(config) == expected_result
 
 
+def test_translate_config_to_brightness_full_range():
+    """Test the translation of every percentage."""
+
+    expected_results = {0: 0, 10: 26, 20: 51, 30: 76, 50: 128, 100: 255}
+    previous = -1
+
+    for percent in range(0, 101):
+        result = translate_config_to_brightness({str(percent): str(percent)})
+        ((brightness, value),) = result.items()
+
+        assert brightness == value, percent
+        assert brightness > previous, percent
+        assert brightness == expected_results.get(percent, brightness), percent
+
+        previous = brightness
+
+    assert previous == 255
+
+
 @pytest.mark.parametrize(
     "config, expected_result",
     [
@@ -815,18 +840,28 @@ def test_create_brightness_map(lightener_level, expected_entity_level):
 
     assert brigtness_map[lightener_level] == expected_entity_level
 
-    # Check if the length is correct
+    # Check if the length and the layout are correct
     assert len(brigtness_map) == 256
+    assert isinstance(brigtness_map, bytes)
+
+
+def test_build_brightness_maps_cached():
+    """Test that the brightness maps are built only once for equal configurations."""
+
+    brightness_maps = build_brightness_maps(((10, 100),))
+
+    assert build_brightness_maps(((10, 100),)) is brightness_maps
+    assert build_brightness_maps(((10, 50),)) is not brightness_maps
 
 
 @pytest.mark.parametrize(
     "entity_level, expected_lightener_level_list",
     [
-        (0, [0, 40]),
-        (15, [5, 25, 47]),
-        (30, [10, 53]),
-        (90, [80]),
-        (255, [255]),
+        (0, (0, 40)),
+        (15, (5, 25, 47)),
+        (30, (10, 53)),
+        (90, (80,)),
+        (255, (255,)),
     ],
 )
 def test_create_reverse_brightness_map(entity_level, expected_lightener_level_list):
@@ -867,10 +902,10 @@ def test_create_reverse_brightness_map_on_off():
     )
 
     # Expected off is a list with 0 and 40
-    expected_lightener_level_list_off = [0, 40]
+    expected_lightener_level_list_off = (0, 40)
 
     # Expected on is a list that goes from 1 to 255, except 40
-    expected_lightener_level_list_on = list(range(1, 40)) + list(range(41, 256))
+    expected_lightener_level_list_on = tuple(range(1, 40)) + tuple(range(41, 256))
 
     assert reverse_brightness_map_on_off[0] == expected_lightener_level_list_off
 